@@ -136,9 +136,9 @@ class ConfigLoader:
     async def get_ollama_models(self) -> list[str]:
         """Get list of available Ollama models"""
         try:
-            # Run ollama list command
-            process = await asyncio.create_subprocess_shell(
-                "ollama list", stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            # Run ollama list command (exec directly, no intermediate shell)
+            process = await asyncio.create_subprocess_exec(
+                "ollama", "list", stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
 
             stdout, stderr = await process.communicate()
@@ -7,6 +7,7 @@ the monitor restarts or crashes.
 
 import sqlite3
 import time
+from collections.abc import Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
@@ -26,6 +27,34 @@ class StoredMessage:
     processing_completed_at: float | None = None
 
 
+# Column list for StoredMessage queries, in dataclass field order
+_STORED_MESSAGE_COLUMNS = (
+    "id, agent, sender, content, timestamp, processed, "
+    "processing_started_at, processing_completed_at"
+)
+
+
+# Insert a message at the tail of its agent's pending queue. seq orders the queue
+# deterministically, even when messages arrive within the same clock tick.
+# Params: (id, agent, sender, content, timestamp, agent)
+_INSERT_MESSAGE_SQL = """
+    INSERT OR IGNORE INTO messages
+    (id, agent, sender, content, timestamp, seq)
+    VALUES (?, ?, ?, ?, ?, (
+        SELECT COALESCE(MAX(seq), 0) + 1 FROM messages
+        WHERE agent = ? AND processed = 0
+    ))
+"""
+
+
+def _stored_message_from_row(cursor: sqlite3.Cursor, row: tuple) -> StoredMessage:
+    """sqlite3 row factory for SELECTs over _STORED_MESSAGE_COLUMNS."""
+    msg_id, agent, sender, content, timestamp, processed, started_at, completed_at = row
+    return StoredMessage(
+        msg_id, agent, sender, content, timestamp, bool(processed), started_at, completed_at
+    )
+
+
 class MessageStore:
     """SQLite-backed message store for mention queuing."""
 
@@ -33,6 +62,7 @@ class MessageStore:
         self.db_path = Path(db_path) if db_path != ":memory:" else db_path
         self._is_memory = db_path == ":memory:"
         self._memory_conn = None  # Keep persistent connection for in-memory DBs
+        self._backlog: dict[str, int] = {}  # agent -> pending count (see get_backlog_count)
 
         # Only create directory for file-based databases
         if db_path != ":memory:":
@@ -45,6 +75,17 @@ class MessageStore:
         """Initialize database schema."""
         try:
             with self._conn() as conn:
+                # Incremental auto-vacuum lets cleanup hand freed pages back to the
+                # filesystem without full VACUUMs. The mode can only change on an
+                # empty database or via a one-time VACUUM of an existing one.
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0:
+                    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    has_tables = conn.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1"
+                    ).fetchone()
+                    if has_tables:
+                        conn.execute("VACUUM")
+
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS messages (
                         id TEXT NOT NULL,
@@ -56,16 +97,31 @@ class MessageStore:
                         processing_started_at REAL,
                         processing_completed_at REAL,
                         created_at REAL DEFAULT (strftime('%s', 'now')),
+                        seq INTEGER NOT NULL DEFAULT 0,
                         PRIMARY KEY (id, agent)
                     )
                 """)
 
+                # Migrate databases created before the seq column existed;
+                # rowid preserves their insertion order
+                columns = {row["name"] for row in conn.execute("PRAGMA table_info(messages)")}
+                if "seq" not in columns:
+                    conn.execute("ALTER TABLE messages ADD COLUMN seq INTEGER NOT NULL DEFAULT 0")
+                    conn.execute("UPDATE messages SET seq = rowid")
+
                 # Index for efficient queries
                 conn.execute("""
                     CREATE INDEX IF NOT EXISTS idx_agent_processed
                     ON messages(agent, processed, timestamp)
                 """)
 
+                # Partial index over pending rows only: orders the queue by seq and
+                # keeps backlog counts index-only regardless of processed history
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_agent_seq
+                    ON messages(agent, seq) WHERE processed = 0
+                """)
+
                 # Agent status table for pause/resume functionality
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS agent_status (
@@ -85,6 +141,15 @@ class MessageStore:
             logging.error(f"Failed to initialize database: {e}")
             raise
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with row access by name."""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        # No cache_size/mmap_size pragmas: file stores open a connection per
+        # call, so the cache never warms up and the extra statements cost more
+        # than they save
+        return conn
+
     @contextmanager
     def _conn(self):
         """Context manager for database connections."""
@@ -92,74 +157,137 @@ class MessageStore:
         # (otherwise each connection creates a fresh empty database)
         if self._is_memory:
             if self._memory_conn is None:
-                self._memory_conn = sqlite3.connect(str(self.db_path))
-                self._memory_conn.row_factory = sqlite3.Row
+                self._memory_conn = self._connect()
             yield self._memory_conn
         else:
             # For file-based databases, create new connection each time
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self._connect()
             try:
                 yield conn
             finally:
                 conn.close()
 
     def store_message(self, msg_id: str, agent: str, sender: str, content: str) -> bool:
-        """Store a new mention message."""
+        """Store a new mention message.
+
+        Uses a single INSERT OR IGNORE against the (id, agent) primary key, so
+        re-delivered messages are dropped without a lookup first. Returns True
+        for duplicates too; only a database error returns False.
+        """
         try:
             with self._conn() as conn:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO messages
-                    (id, agent, sender, content, timestamp)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (msg_id, agent, sender, content, time.time()),
+                cursor = conn.execute(
+                    _INSERT_MESSAGE_SQL, (msg_id, agent, sender, content, time.time(), agent)
                 )
                 conn.commit()
+                if cursor.rowcount > 0 and agent in self._backlog:
+                    self._backlog[agent] += cursor.rowcount
                 return True
         except sqlite3.Error:
             return False
 
+    def store_messages(self, messages: Iterable[tuple[str, str, str, str]]) -> bool:
+        """Store several mention messages in a single transaction.
+
+        Args:
+            messages: (msg_id, agent, sender, content) tuples, queued in order.
+
+        Same semantics as store_message, but with one commit for the whole batch.
+        On a database error nothing is stored and False is returned.
+        """
+        added: dict[str, int] = {}
+        try:
+            with self._conn() as conn:
+                # Connection as context manager: commit on success, roll back on any
+                # error (the in-memory connection is shared, so never leave it dirty)
+                with conn:
+                    for msg_id, agent, sender, content in messages:
+                        cursor = conn.execute(
+                            _INSERT_MESSAGE_SQL,
+                            (msg_id, agent, sender, content, time.time(), agent),
+                        )
+                        added[agent] = added.get(agent, 0) + cursor.rowcount
+        except sqlite3.Error:
+            return False
+
+        for agent, count in added.items():
+            if count > 0 and agent in self._backlog:
+                self._backlog[agent] += count
+        return True
+
     def get_pending_messages(
         self, agent: str, limit: int = 10, order: str = "desc"
     ) -> list[StoredMessage]:
-        """Get unprocessed messages for an agent, ordered by timestamp.
+        """Get unprocessed messages for an agent, ordered by arrival.
 
         Args:
             agent: Agent name to fetch pending messages for.
             limit: Maximum number of messages to return.
             order: "desc" (default) for FILO processing or "asc" for FIFO-style ordering.
         """
+        with self._conn() as conn:
+            return self._fetch_pending(conn, agent, limit, order)
+
+    def get_agent_snapshot(
+        self, agent: str, limit: int = 10, order: str = "desc"
+    ) -> tuple[bool, list[StoredMessage]]:
+        """Get whether an agent is paused and its pending messages in one read.
+
+        Both queries share a connection and a read transaction, so the paused
+        flag and the queue come from the same database state.
+
+        Args:
+            agent: Agent name.
+            limit: Maximum number of messages to return.
+            order: "desc" (default) for FILO processing or "asc" for FIFO-style ordering.
+
+        Returns:
+            (paused, pending messages), as from is_agent_paused and get_pending_messages
+        """
+        with self._conn() as conn:
+            own_transaction = not conn.in_transaction
+            if own_transaction:
+                conn.execute("BEGIN")
+            try:
+                row = conn.execute(
+                    "SELECT status FROM agent_status WHERE agent = ?", (agent,)
+                ).fetchone()
+                paused = row is not None and row["status"] == "paused"
+                pending = self._fetch_pending(conn, agent, limit, order)
+            finally:
+                if own_transaction:
+                    conn.commit()
+            return paused, pending
+
+    def _fetch_pending(
+        self, conn: sqlite3.Connection, agent: str, limit: int, order: str
+    ) -> list[StoredMessage]:
+        """Query an agent's pending messages on an open connection."""
         order_normalized = (order or "desc").lower()
         if order_normalized not in {"asc", "desc"}:
             order_normalized = "desc"
         order_clause = "DESC" if order_normalized == "desc" else "ASC"
 
-        with self._conn() as conn:
-            rows = conn.execute(
-                f"""
-                SELECT * FROM messages
-                WHERE agent = ? AND processed = 0
-                ORDER BY timestamp {order_clause}
-                LIMIT ?
-                """,
-                (agent, limit),
-            ).fetchall()
-
-            return [
-                StoredMessage(
-                    id=row["id"],
-                    agent=row["agent"],
-                    sender=row["sender"],
-                    content=row["content"],
-                    timestamp=row["timestamp"],
-                    processed=bool(row["processed"]),
-                    processing_started_at=row["processing_started_at"],
-                    processing_completed_at=row["processing_completed_at"],
-                )
-                for row in rows
-            ]
+        # Build StoredMessage objects directly from the row tuples instead of
+        # going through sqlite3.Row; column order matches the dataclass fields
+        cursor = conn.cursor()
+        cursor.row_factory = _stored_message_from_row
+        messages = cursor.execute(
+            f"""
+            SELECT {_STORED_MESSAGE_COLUMNS} FROM messages
+            WHERE agent = ? AND processed = 0
+            ORDER BY seq {order_clause}
+            LIMIT ?
+            """,
+            (agent, limit),
+        ).fetchall()
+
+        # A short page is the whole backlog - resync the memoized count so
+        # writes from other processes (e.g. dashboard clears) are picked up
+        if len(messages) < limit:
+            self._backlog[agent] = len(messages)
+
+        return messages
 
     def mark_processing_started(self, msg_id: str, agent: str = None) -> bool:
         """Mark a message as being processed (prevents duplicate processing)."""
@@ -196,37 +324,78 @@ class MessageStore:
             with self._conn() as conn:
                 if agent:
                     # With composite key: update only this agent's message
-                    conn.execute(
+                    cursor = conn.execute(
                         """
                         UPDATE messages
                         SET processed = 1, processing_completed_at = ?
-                        WHERE id = ? AND agent = ?
+                        WHERE id = ? AND agent = ? AND processed = 0
                         """,
                         (time.time(), msg_id, agent),
                     )
+                    conn.commit()
+                    if cursor.rowcount > 0 and agent in self._backlog:
+                        self._backlog[agent] = max(0, self._backlog[agent] - cursor.rowcount)
                 else:
                     # Backward compatibility: update by id only
                     conn.execute(
                         """
                         UPDATE messages
                         SET processed = 1, processing_completed_at = ?
-                        WHERE id = ?
+                        WHERE id = ? AND processed = 0
                         """,
                         (time.time(), msg_id),
                     )
+                    conn.commit()
+                    # Can't tell which agents were affected - recount lazily
+                    self._backlog.clear()
+                return True
+        except sqlite3.Error:
+            return False
+
+    def mark_completed_atomic(self, msg_id: str, agent: str) -> bool:
+        """Mark a message as started and processed in a single UPDATE.
+
+        For handlers that finish synchronously, where a separate
+        mark_processing_started() round-trip buys nothing. Keeps an existing
+        processing_started_at if one was already recorded.
+        """
+        try:
+            with self._conn() as conn:
+                now = time.time()
+                cursor = conn.execute(
+                    """
+                    UPDATE messages
+                    SET processed = 1,
+                        processing_started_at = COALESCE(processing_started_at, ?),
+                        processing_completed_at = ?
+                    WHERE id = ? AND agent = ? AND processed = 0
+                    """,
+                    (now, now, msg_id, agent),
+                )
                 conn.commit()
+                if cursor.rowcount > 0 and agent in self._backlog:
+                    self._backlog[agent] = max(0, self._backlog[agent] - cursor.rowcount)
                 return True
         except sqlite3.Error:
             return False
 
     def get_backlog_count(self, agent: str) -> int:
-        """Get count of unprocessed messages for an agent."""
-        with self._conn() as conn:
-            row = conn.execute(
-                "SELECT COUNT(*) as count FROM messages WHERE agent = ? AND processed = 0",
-                (agent,),
-            ).fetchone()
-            return row["count"] if row else 0
+        """Get count of unprocessed messages for an agent.
+
+        The count is memoized per agent and kept current by this store's own
+        writes, so the processor loop can poll it every tick without hitting
+        SQLite. The first call for an agent does an index-only recount.
+        """
+        count = self._backlog.get(agent)
+        if count is None:
+            with self._conn() as conn:
+                row = conn.execute(
+                    "SELECT COUNT(*) as count FROM messages WHERE agent = ? AND processed = 0",
+                    (agent,),
+                ).fetchone()
+            count = row["count"] if row else 0
+            self._backlog[agent] = count
+        return count
 
     def get_total_processed(self, agent: str) -> int:
         """Get count of all processed messages for an agent."""
@@ -252,6 +421,20 @@ class MessageStore:
             conn.commit()
             return cursor.rowcount
 
+    def vacuum_incremental(self, pages: int = 100) -> bool:
+        """Return up to `pages` free pages to the filesystem.
+
+        Cheap enough to call after every cleanup; a no-op when nothing is free.
+        """
+        try:
+            with self._conn() as conn:
+                # executescript steps the pragma to completion; execute() would
+                # only run its first step and free a single page
+                conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+                return True
+        except sqlite3.Error:
+            return False
+
     def get_stats(self, agent: str) -> dict:
         """Get statistics for an agent."""
         with self._conn() as conn:
@@ -288,6 +471,7 @@ class MessageStore:
                 (agent,),
             )
             conn.commit()
+            self._backlog[agent] = 0
             return cursor.rowcount
 
     def clear_pending_messages(self, agent: str) -> int:
@@ -302,6 +486,7 @@ class MessageStore:
                 (agent,),
             )
             conn.commit()
+            self._backlog[agent] = 0
             return cursor.rowcount
 
     def pause_agent(self, agent: str, reason: str = "", resume_at: float | None = None) -> bool:
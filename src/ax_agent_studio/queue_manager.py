@@ -12,7 +12,7 @@ Architecture:
 
 Benefits:
 - Zero message loss (SQLite buffer)
-- FILO focus (ORDER BY timestamp DESC) so the agent can respond to the latest state while seeing the queue snapshot
+- FILO focus (ORDER BY seq DESC, newest arrival first) so the agent can respond to the latest state while seeing the queue snapshot
 - Crash resilient (persistent storage)
 - Connection resilient (heartbeat prevents 5-minute timeout)
 - Modular (any monitor can use it)
@@ -591,5 +591,7 @@ class QueueManager:
             Number of messages deleted
         """
         count = self.store.cleanup_old_messages(days)
+        if count > 0:
+            self.store.vacuum_incremental()
         logger.info(f"  Cleaned up {count} messages older than {days} days")
         return count
@@ -5,11 +5,6 @@ Verifies agents can have back-and-forth without missing messages
 """
 
 import asyncio
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
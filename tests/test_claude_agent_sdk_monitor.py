@@ -2,10 +2,6 @@
 
 import sys
 import types
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.append(str(PROJECT_ROOT / "src"))
 
 if "ax_agent_studio.config" not in sys.modules:  # pragma: no cover - dependency shim for tests
     config_stub = types.ModuleType("ax_agent_studio.config")
@@ -7,7 +7,6 @@ Tests all agent types and their configuration requirements
 import asyncio
 import os
 import sys
-from pathlib import Path
 
 import httpx
 import pytest
@@ -15,10 +14,6 @@ import pytest
 # Mark all tests in this file as e2e tests
 pytestmark = pytest.mark.e2e
 
-# Add src to path
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-
 # Dashboard API base URL
 DASHBOARD_URL = os.getenv("DASHBOARD_URL", "http://localhost:8000")
 
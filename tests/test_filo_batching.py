@@ -204,12 +204,6 @@ import {{ MCPClientManager }} from '@mcpjam/sdk';
             print("✅ TEST PASSED: FILO batching working correctly")
             print("=" * 80)
 
-        except Exception as e:
-            print(f"\n❌ ERROR: {e}")
-            import traceback
-
-            traceback.print_exc()
-            pytest.fail("Test assertion failed")
         finally:
             api.cleanup_all()
 
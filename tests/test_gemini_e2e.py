@@ -121,11 +121,13 @@ if __name__ == "__main__":
     print("=" * 60 + "\n")
 
     try:
-        # Test 1: Tool schema generation
-        asyncio.run(test_gemini_tool_schema())
+        # One event loop for both tests rather than a fresh asyncio.run() each
+        with asyncio.Runner() as runner:
+            # Test 1: Tool schema generation
+            runner.run(test_gemini_tool_schema())
 
-        # Test 2: Simple call
-        asyncio.run(test_gemini_simple_call())
+            # Test 2: Simple call
+            runner.run(test_gemini_simple_call())
 
         print(" All E2E tests passed!")
 
@@ -6,6 +6,7 @@ Tests verify that multiple agents can store and process the same message ID
 independently, which is critical for multi-agent @mention scenarios.
 """
 
+import sqlite3
 import tempfile
 import time
 from pathlib import Path
@@ -19,18 +20,9 @@ class TestMessageStoreMultiAgent:
     """Test MessageStore with multiple agents sharing message IDs."""
 
     @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-        yield db_path
-        # Cleanup
-        Path(db_path).unlink(missing_ok=True)
-
-    @pytest.fixture
-    def store(self, temp_db):
-        """Create a MessageStore instance with temp database."""
-        return MessageStore(db_path=temp_db)
+    def store(self):
+        """Create a MessageStore instance with a private in-memory database."""
+        return MessageStore(db_path=":memory:")
 
     def test_same_message_multiple_agents(self, store):
         """Test that multiple agents can store the same message ID."""
@@ -117,13 +109,26 @@ class TestMessageStoreMultiAgent:
         assert store.get_backlog_count("agent2") == 2
         assert store.get_backlog_count("agent3") == 0
 
+        # Cached counts must track later writes
+        store.store_message("msg3", "agent1", "user", "content3")  # duplicate, ignored
+        store.mark_processed("msg1", "agent1")
+        store.mark_processed("msg1", "agent1")  # already processed, no double decrement
+        store.store_message("msg4", "agent3", "user", "content4")
+
+        assert store.get_backlog_count("agent1") == 2
+        assert store.get_backlog_count("agent2") == 2
+        assert store.get_backlog_count("agent3") == 1
+
+        # Cold cache recounts from SQLite
+        store._backlog.clear()
+        assert store.get_backlog_count("agent1") == 2
+        assert store.get_backlog_count("agent3") == 1
+
     def test_filo_ordering_per_agent(self, store):
         """Test that messages are retrieved in FILO order per agent."""
-        # Insert messages with slight delays to ensure different timestamps
+        # Back-to-back inserts - ordering comes from the seq column, not timestamps
         store.store_message("msg1", "agent1", "user", "first")
-        time.sleep(0.01)
         store.store_message("msg2", "agent1", "user", "second")
-        time.sleep(0.01)
         store.store_message("msg3", "agent1", "user", "third")
 
         # Get all messages
@@ -189,17 +194,9 @@ class TestMessageStoreBasicFunctionality:
     """Test basic MessageStore operations."""
 
     @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-        yield db_path
-        Path(db_path).unlink(missing_ok=True)
-
-    @pytest.fixture
-    def store(self, temp_db):
-        """Create a MessageStore instance with temp database."""
-        return MessageStore(db_path=temp_db)
+    def store(self):
+        """Create a MessageStore instance with a private in-memory database."""
+        return MessageStore(db_path=":memory:")
 
     def test_store_and_retrieve(self, store):
         """Test basic store and retrieve operations."""
@@ -220,6 +217,28 @@ class TestMessageStoreBasicFunctionality:
         assert messages[0].sender == sender
         assert messages[0].content == content
 
+    def test_store_messages_batch(self, store):
+        """Test storing several messages in one transaction."""
+        # Prime the memoized backlog count so the batch has to keep it in sync
+        assert store.get_backlog_count("agent1") == 0
+
+        success = store.store_messages(
+            [
+                ("batch-1", "agent1", "user", "first"),
+                ("batch-2", "agent1", "user", "second"),
+                ("batch-1", "agent1", "user", "duplicate"),  # Ignored like store_message
+                ("batch-1", "agent2", "user", "other agent"),
+            ]
+        )
+        assert success is True
+
+        # Queue order follows batch order
+        messages = store.get_pending_messages("agent1", order="asc")
+        assert [m.id for m in messages] == ["batch-1", "batch-2"]
+        assert messages[0].content == "first"
+        assert store.get_backlog_count("agent1") == 2
+        assert store.get_backlog_count("agent2") == 1
+
     def test_mark_processing(self, store):
         """Test marking messages as processing and completed."""
         msg_id = "process-test"
@@ -242,36 +261,104 @@ class TestMessageStoreBasicFunctionality:
         messages = store.get_pending_messages(agent)
         assert len(messages) == 0
 
+    def test_mark_completed_atomic(self, store):
+        """Test completing a message in one step without marking it started first."""
+        msg_id = "atomic-test"
+        agent = "agent1"
 
-def test_mark_processing_methods():
-    """Test that mark_processing methods accept agent parameter."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
+        store.store_message(msg_id, agent, "user", "content")
+        store.store_message(msg_id, "agent2", "user", "content")
 
-    try:
-        store = MessageStore(db_path=db_path)
+        assert store.mark_completed_atomic(msg_id, agent) is True
 
-        # Store a message
-        store.store_message("msg1", "agent1", "user", "content")
+        # Gone from this agent's queue, other agent unaffected
+        assert store.get_pending_messages(agent) == []
+        assert store.get_backlog_count(agent) == 0
+        assert len(store.get_pending_messages("agent2")) == 1
 
-        # These should work with agent parameter (for composite key)
-        store.mark_processing_started("msg1", "agent1")
-        store.mark_processed("msg1", "agent1")
+        # Both timestamps recorded by the single UPDATE
+        with store._conn() as conn:
+            row = conn.execute(
+                "SELECT processing_started_at, processing_completed_at FROM messages "
+                "WHERE id = ? AND agent = ?",
+                (msg_id, agent),
+            ).fetchone()
+        assert row["processing_started_at"] is not None
+        assert row["processing_completed_at"] is not None
+
+    def test_incremental_auto_vacuum(self, tmp_path):
+        """Test that vacuum_incremental returns the requested number of free pages."""
+        store = MessageStore(db_path=str(tmp_path / "vacuum.db"))
+        with store._conn() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # INCREMENTAL
+
+        # ~1 MB of content, so clearing it leaves well over `pages` free pages
+        store.store_messages([(f"vacuum-{i}", "agent1", "user", "x" * 4096) for i in range(256)])
+        store.clear_agent("agent1")
+
+        def freelist_count():
+            with store._conn() as conn:
+                return conn.execute("PRAGMA freelist_count").fetchone()[0]
 
-    finally:
-        Path(db_path).unlink(missing_ok=True)
+        pages = 10
+        before = freelist_count()
+        assert before > pages
+
+        assert store.vacuum_incremental(pages) is True
+        assert freelist_count() == before - pages
+
+
+def test_mark_processing_methods(tmp_path):
+    """Test that mark_processing methods accept agent parameter."""
+    store = MessageStore(db_path=str(tmp_path / "test.db"))
+
+    # Store a message
+    store.store_message("msg1", "agent1", "user", "content")
+
+    # These should work with agent parameter (for composite key)
+    store.mark_processing_started("msg1", "agent1")
+    store.mark_processed("msg1", "agent1")
+
+
+def test_seq_migration_preserves_pending_order(tmp_path):
+    """Test that a database from before the seq column keeps its queue order."""
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE messages (
+                id TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                sender TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                processed INTEGER DEFAULT 0,
+                processing_started_at REAL,
+                processing_completed_at REAL,
+                created_at REAL DEFAULT (strftime('%s', 'now')),
+                PRIMARY KEY (id, agent)
+            )
+        """)
+        # Identical timestamps, so only insertion (rowid) order tells them apart
+        conn.executemany(
+            "INSERT INTO messages (id, agent, sender, content, timestamp) VALUES (?, ?, ?, ?, ?)",
+            [(f"old{i}", "agent1", "user", f"old {i}", 1000.0) for i in range(1, 4)],
+        )
+    conn.close()
+
+    store = MessageStore(db_path=str(db_path))
+    store.store_message("new", "agent1", "user", "new")
+
+    messages = store.get_pending_messages("agent1", limit=10)
+    assert [m.content for m in messages] == ["new", "old 3", "old 2", "old 1"]
 
 
 class TestDoneCommandMessageClearing:
     """Test #done command auto-resume message clearing."""
 
     @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-        yield db_path
-        Path(db_path).unlink(missing_ok=True)
+    def temp_db(self, tmp_path):
+        """Create a temporary database for testing (pytest removes tmp_path and any sidecars)."""
+        return str(tmp_path / "test.db")
 
     @pytest.fixture
     def store(self, temp_db):
@@ -347,11 +434,8 @@ if __name__ == "__main__":
         print("pytest not found, running basic tests...")
 
         # Run a basic smoke test
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        try:
-            store = MessageStore(db_path=db_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = MessageStore(db_path=str(Path(tmp_dir) / "test.db"))
 
             # Test multi-agent scenario
             msg_id = "demo-msg"
@@ -374,8 +458,7 @@ if __name__ == "__main__":
 
             # Test processing independence
             print(" Testing processing independence...")
-            store.mark_processing_started(msg_id, "lunar_craft_128")
-            store.mark_processed(msg_id, "lunar_craft_128")
+            store.mark_completed_atomic(msg_id, "lunar_craft_128")
 
             lunar_msgs = store.get_pending_messages("lunar_craft_128")
             orion_msgs = store.get_pending_messages("orion_344")
@@ -387,6 +470,3 @@ if __name__ == "__main__":
 
             print(" Processing one agent doesn't affect others!")
             print("\n All basic tests passed!")
-
-        finally:
-            Path(db_path).unlink(missing_ok=True)
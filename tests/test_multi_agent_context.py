@@ -32,16 +32,74 @@ NOTE: This test requires the dashboard to be running (uv run dashboard).
 It will be skipped if the dashboard is not accessible.
 """
 
+import asyncio
+import mmap
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
 from pathlib import Path
 
 import pytest
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tests.e2e.helpers.dashboard_api import DashboardAPI
 
+# (sender, content) in send order - only the last message @mentions anyone
+CONVERSATION = [
+    ("lunar_ray_510", "Message 1: I am seeing performance issues in the system"),
+    ("lunar_ray_510", "Message 2: CPU usage is at 90% and climbing"),
+    ("lunar_craft_128", "Message 3: I am getting timeout errors from the API"),
+    ("lunar_craft_128", "Message 4: Database response time has increased to 5 seconds"),
+    ("orion_344", "@ghost_ray_363 Can you diagnose what is causing these issues?"),
+]
+
+
+async def send_conversation():
+    """Send CONVERSATION through the platform, one MCP session per sender.
+
+    Each sender connects via mcp-remote and calls the `messages` tool, so
+    @mention routing is done by the platform, not by this test.
+    """
+    async with AsyncExitStack() as stack:
+        sessions = {}
+        for sender in dict.fromkeys(sender for sender, _ in CONVERSATION):
+            server_params = StdioServerParameters(
+                command="npx",
+                args=[
+                    "-y",
+                    "mcp-remote@0.1.29",
+                    f"http://localhost:8002/mcp/agents/{sender}",
+                    "--transport",
+                    "http-only",
+                    "--allow-http",
+                    "--oauth-server",
+                    "http://localhost:8001",
+                ],
+            )
+            read, write = await stack.enter_async_context(stdio_client(server_params))
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+            sessions[sender] = session
+
+        for i, (sender, content) in enumerate(CONVERSATION, 1):
+            result = await sessions[sender].call_tool(
+                "messages", {"action": "send", "content": content}
+            )
+            if result.isError:
+                raise RuntimeError(f"{sender} failed to send message {i}: {result.content}")
+            print(f"   ✓ {sender}: Message {i}")
+            # Small gap so the platform keeps the messages in send order
+            await asyncio.sleep(0.2)
+
+
+def log_contains(log: mmap.mmap, *needles: str) -> bool:
+    """True if every needle appears in the mapped log (searched as bytes, no decode)."""
+    return all(log.find(needle.encode()) != -1 for needle in needles)
+
 
 def is_dashboard_available():
     """Check if dashboard is accessible"""
@@ -105,9 +163,20 @@ def test_multi_agent_context_awareness():
                 print(f"      ✓ {result['monitor_id']}")
 
             # 3. Wait for all monitors to be ready
+            # Wait concurrently so the total is bounded by the slowest agent, not the sum
             print("\n3. Waiting for all monitors to be ready...")
-            for agent_name in agents.keys():
-                if api.wait_for_monitor_ready(agent_name, timeout=15):
+            with ThreadPoolExecutor(max_workers=len(agents)) as executor:
+                ready = dict(
+                    zip(
+                        agents,
+                        executor.map(
+                            lambda name: api.wait_for_monitor_ready(name, timeout=15), agents
+                        ),
+                        strict=True,
+                    )
+                )
+            for agent_name, is_ready in ready.items():
+                if is_ready:
                     print(f"   ✓ {agent_name} ready")
                 else:
                     print(f"   ❌ {agent_name} not ready")
@@ -116,109 +185,9 @@ def test_multi_agent_context_awareness():
             # 4. Simulate multi-agent conversation
             print("\n4. Simulating multi-agent conversation (5 messages)...")
 
-            # Use Node.js script to send messages from different agents
-            import subprocess
-
-            conversation_script = Path(__file__).parent / "e2e" / "send_multi_agent_conversation.js"
-
-            if not conversation_script.exists():
-                # Create inline conversation script
-                node_code = """
-import { MCPClientManager } from '@mcpjam/sdk';
-
-const agents = {
-  lunar_ray_510: {
-    command: 'npx',
-    args: ['-y', 'mcp-remote@0.1.29', 'http://localhost:8002/mcp/agents/lunar_ray_510',
-           '--transport', 'http-only', '--allow-http', '--oauth-server', 'http://localhost:8001']
-  },
-  lunar_craft_128: {
-    command: 'npx',
-    args: ['-y', 'mcp-remote@0.1.29', 'http://localhost:8002/mcp/agents/lunar_craft_128',
-           '--transport', 'http-only', '--allow-http', '--oauth-server', 'http://localhost:8001']
-  },
-  orion_344: {
-    command: 'npx',
-    args: ['-y', 'mcp-remote@0.1.29', 'http://localhost:8002/mcp/agents/orion_344',
-           '--transport', 'http-only', '--allow-http', '--oauth-server', 'http://localhost:8001']
-  }
-};
-
-(async () => {
-  try {
-    console.log('Simulating multi-agent conversation...');
-
-    const manager = new MCPClientManager(agents, {
-      defaultClientName: 'Multi-Agent Test',
-      defaultClientVersion: '1.0.0'
-    });
-
-    // Agent A reports performance issues
-    await manager.executeTool('lunar_ray_510', 'messages', {
-      action: 'send',
-      content: 'Message 1: I am seeing performance issues in the system'
-    });
-    console.log('  ✓ lunar_ray_510: Message 1 (performance issues)');
-    await new Promise(r => setTimeout(r, 200));
-
-    await manager.executeTool('lunar_ray_510', 'messages', {
-      action: 'send',
-      content: 'Message 2: CPU usage is at 90% and climbing'
-    });
-    console.log('  ✓ lunar_ray_510: Message 2 (CPU at 90%)');
-    await new Promise(r => setTimeout(r, 200));
-
-    // Agent B reports related errors
-    await manager.executeTool('lunar_craft_128', 'messages', {
-      action: 'send',
-      content: 'Message 3: I am getting timeout errors from the API'
-    });
-    console.log('  ✓ lunar_craft_128: Message 3 (timeout errors)');
-    await new Promise(r => setTimeout(r, 200));
-
-    await manager.executeTool('lunar_craft_128', 'messages', {
-      action: 'send',
-      content: 'Message 4: Database response time has increased to 5 seconds'
-    });
-    console.log('  ✓ lunar_craft_128: Message 4 (slow database)');
-    await new Promise(r => setTimeout(r, 200));
-
-    // Coordinator asks Observer to diagnose
-    await manager.executeTool('orion_344', 'messages', {
-      action: 'send',
-      content: '@ghost_ray_363 Can you diagnose what is causing these issues?'
-    });
-    console.log('  ✓ orion_344: Message 5 (diagnosis request to @ghost_ray_363)');
-
-    console.log('All 5 messages sent successfully!');
-    process.exit(0);
-  } catch (error) {
-    console.error('Error:', error.message);
-    process.exit(1);
-  }
-})();
-"""
-                temp_script = Path("/tmp/send_multi_agent_conversation.mjs")
-                temp_script.write_text(node_code)
-                conversation_script = temp_script
-
-            result = subprocess.run(
-                ["node", str(conversation_script)],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if result.returncode == 0:
-                print("   ✓ All 5 messages sent")
-                if result.stdout:
-                    for line in result.stdout.splitlines():
-                        print(f"     {line}")
-            else:
-                print("   ❌ Failed to send messages")
-                if result.stderr:
-                    print(f"     Error: {result.stderr[:200]}")
-                pytest.fail("Test assertion failed")
+            # Send from Python MCP sessions rather than a generated Node script
+            asyncio.run(send_conversation())
+            print("   ✓ All 5 messages sent")
 
             # 5. Wait for processing
             print("\n5. Waiting for Observer to process queue...")
@@ -228,17 +197,21 @@ const agents = {
             print("\n6. Checking Observer logs for multi-agent context awareness...")
             log_file = Path("logs") / f"{monitor_ids['ghost_ray_363']}.log"
 
-            if log_file.exists():
-                log_content = log_file.read_text()
-
-                # CURRENT BEHAVIOR: Observer only sees messages that @mention it
-                # Check that Observer received the @mention from orion_344
-                found_orion_message = "orion_344" in log_content and "diagnose" in log_content
-
-                # Check that Observer did NOT receive messages without @mentions
-                # (validates current @mention-only behavior)
-                found_lunar_ray = "lunar_ray_510" in log_content and "performance" in log_content
-                found_lunar_craft = "lunar_craft_128" in log_content and "timeout" in log_content
+            if log_file.exists() and log_file.stat().st_size:
+                # Map the log rather than reading it into a str: the checks below are
+                # plain substring searches, which mmap.find runs in place
+                with (
+                    open(log_file, "rb") as f,
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log,
+                ):
+                    # CURRENT BEHAVIOR: Observer only sees messages that @mention it
+                    # Check that Observer received the @mention from orion_344
+                    found_orion_message = log_contains(log, "orion_344", "diagnose")
+
+                    # Check that Observer did NOT receive messages without @mentions
+                    # (validates current @mention-only behavior)
+                    found_lunar_ray = log_contains(log, "lunar_ray_510", "performance")
+                    found_lunar_craft = log_contains(log, "lunar_craft_128", "timeout")
 
                 print("\n   Current Behavior Analysis (@ mention-only):")
                 print(
@@ -278,15 +251,9 @@ const agents = {
                     pytest.fail("Test assertion failed")
 
             else:
-                print(f"   ❌ Log file not found: {log_file}")
+                print(f"   ❌ Log file not found or empty: {log_file}")
                 pytest.fail("Test assertion failed")
 
-        except Exception as e:
-            print(f"\n❌ ERROR: {e}")
-            import traceback
-
-            traceback.print_exc()
-            pytest.fail("Test assertion failed")
         finally:
             print("\n7. Cleanup...")
             api.cleanup_all()
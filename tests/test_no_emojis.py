@@ -8,55 +8,85 @@ the codebase remains emoji-free for cross-platform compatibility.
 Run with: pytest tests/test_no_emojis.py
 """
 
+import hashlib
+import inspect
+import json
+import math
+import mmap
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pytest
 
-# Emoji pattern - covers emoji ranges, variation selectors, and joiners
-EMOJI_PATTERN = re.compile(
-    "["
-    "\U0001f600-\U0001f64f"  # emoticons
-    "\U0001f300-\U0001f5ff"  # symbols & pictographs
-    "\U0001f680-\U0001f6ff"  # transport & map symbols
-    "\U0001f700-\U0001f77f"  # alchemical symbols
-    "\U0001f780-\U0001f7ff"  # Geometric Shapes Extended
-    "\U0001f800-\U0001f8ff"  # Supplemental Arrows-C
-    "\U0001f900-\U0001f9ff"  # Supplemental Symbols and Pictographs
-    "\U0001fa00-\U0001fa6f"  # Chess Symbols
-    "\U0001fa70-\U0001faff"  # Symbols and Pictographs Extended-A
-    "\U00002600-\U000027bf"  # Miscellaneous Symbols
-    "\U0001f1e6-\U0001f1ff"  # flags
-    "\ufe0e\ufe0f"  # variation selectors (text/emoji style)
-    "\u200d"  # zero-width joiner (combines emoji sequences)
-    "\u200b\u200c"  # zero-width space, zero-width non-joiner
-    "]+",
-    flags=re.UNICODE,
+# Emoji codepoint ranges - covers emoji blocks, variation selectors, and joiners
+EMOJI_RANGES = [
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map symbols
+    (0x1F700, 0x1F77F),  # alchemical symbols
+    (0x1F780, 0x1F7FF),  # Geometric Shapes Extended
+    (0x1F800, 0x1F8FF),  # Supplemental Arrows-C
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+    (0x1FA00, 0x1FA6F),  # Chess Symbols
+    (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
+    (0x2600, 0x27BF),  # Miscellaneous Symbols
+    (0x1F1E6, 0x1F1FF),  # flags
+    (0xFE0E, 0xFE0F),  # variation selectors (text/emoji style)
+    (0x200D, 0x200D),  # zero-width joiner (combines emoji sequences)
+    (0x200B, 0x200C),  # zero-width space, zero-width non-joiner
+]
+
+# Single character class over the ranges above. The possessive ++ never gives
+# back characters, so matching stays linear even if the pattern is extended.
+EMOJI_PATTERN = re.compile("[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in EMOJI_RANGES) + "]++")
+
+# UTF-8 lead bytes of every codepoint in EMOJI_RANGES (0xE2, 0xEF, 0xF0). A file
+# with none of them can't contain an emoji, and checking is a memchr per byte.
+# Lead bytes grow with the codepoint, so each range's endpoints bound its leads.
+EMOJI_LEAD_BYTES = tuple(
+    bytes([lead])
+    for lead in sorted(
+        {
+            lead
+            for lo, hi in EMOJI_RANGES
+            for lead in range(chr(lo).encode()[0], chr(hi).encode()[0] + 1)
+        }
+    )
 )
 
-# File extensions to check
-EXTENSIONS = {".py", ".md", ".yaml", ".yml", ".json", ".sh", ".bat", ".txt"}
+# Files handed to each worker process at a time
+SCAN_CHUNKSIZE = 64
+
+# Rescans of up to this many files run in-process. Pool startup costs more than
+# it saves below this: the whole tree (~120 files) scans faster serially.
+SERIAL_SCAN_MAX = 512
+
+# File extensions to check (tuple so str.endswith can test them all at once)
+EXTENSIONS = (".py", ".md", ".yaml", ".yml", ".json", ".sh", ".bat", ".txt")
 
 # Directories to skip
-SKIP_DIRS = {
-    ".git",
-    "node_modules",
-    "__pycache__",
-    ".venv",
-    "venv",
-    "data",
-    "logs",
-    "dist",
-    "build",
-    ".eggs",
-    "htmlcov",
-    ".pytest_cache",
-    ".tox",
-    "agent_files",
-    "agent_memory",
-    "uv.lock",
-}
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "data",
+        "logs",
+        "dist",
+        "build",
+        ".eggs",
+        "htmlcov",
+        ".pytest_cache",
+        ".tox",
+        "agent_files",
+        "agent_memory",
+        "uv.lock",
+    }
+)
 
 # Files to skip (allowed to have emojis)
 SKIP_FILES = {
@@ -68,62 +98,198 @@ SKIP_FILES = {
 }
 
 
+# All SKIP_FILES substrings folded into one regex, so each path is searched once
+SKIP_FILES_PATTERN = re.compile("|".join(re.escape(pattern) for pattern in SKIP_FILES))
+
+
 def should_skip_file(filepath: str) -> bool:
     """Check if file should be skipped."""
-    for skip_pattern in SKIP_FILES:
-        if skip_pattern in filepath:
-            return True
-    return False
+    # SKIP_FILES uses forward slashes; normalize so they also match on Windows
+    return SKIP_FILES_PATTERN.search(filepath.replace(os.sep, "/")) is not None
+
+
+def iter_source_files(project_root: Path):
+    """Yield (path, relative_path, stat) for every file the emoji check covers.
+
+    Iterative os.scandir walk: directory/file classification comes from the
+    cached DirEntry type, and relative paths are sliced off the entry path
+    instead of going through os.path.relpath.
+    """
+    root = str(project_root)
+    root_len = len(root) + 1
+    stack = [root]
+
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Like os.walk: skip directories that are unreadable or gone
+            continue
+        with entries:
+            for entry in entries:
+                # Like os.walk: don't descend into symlinked directories, but do
+                # check symlinked files (is_file() follows the link)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(EXTENSIONS) and entry.is_file():
+                    relative_path = entry.path[root_len:]
+                    if not should_skip_file(relative_path):
+                        yield entry.path, relative_path, entry.stat()
+
+
+def _scan_one(filepath: str, relative_path: str) -> dict | None:
+    """Scan a single file for emojis, returning a report entry or None if clean."""
+    try:
+        # A raw descriptor is all mmap needs; open() would also build a buffered
+        # file object per file that is never read through
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size == 0:
+                return None  # mmap can't map empty files
+
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                # Fast path: without an emoji lead byte there's nothing to find, so
+                # skip the decode and regex entirely. This rejects pure-ASCII files
+                # (the vast majority) and most other non-ASCII text, and mmap.find
+                # searches the mapping in place without copying it.
+                if all(mm.find(lead) == -1 for lead in EMOJI_LEAD_BYTES):
+                    return None
+
+                # Decode straight from the mapping, skipping an intermediate bytes copy
+                content = str(mm, "utf-8")
+        finally:
+            os.close(fd)
+
+        # Single pass over the matches: count every run, and map the first few
+        # offsets to line numbers without splitting the file into lines
+        count = 0
+        lines_with_emojis = []
+        line_no, pos = 1, 0  # line_no is the line containing offset pos
+        line_end = -1
+        for match in EMOJI_PATTERN.finditer(content):
+            count += 1
+            start = match.start()
+            if len(lines_with_emojis) >= 5 or start <= line_end:
+                # Enough previews already, or still on the last reported line
+                continue
 
+            line_no += content.count("\n", pos, start)
+            pos = start
+            line_end = content.find("\n", start)
+            if line_end == -1:
+                line_end = len(content)
+            line_start = content.rfind("\n", 0, start) + 1
 
-def find_files_with_emojis():
-    """Find all files containing emojis."""
-    files_with_emojis = []
+            # Show emoji and context; slice only the preview, not the whole line,
+            # so a single-line bundle (minified JSON etc.) isn't copied wholesale
+            preview = content[line_start : min(line_end, line_start + 80)]
+            if line_end - line_start > 80:
+                preview += "..."
+            lines_with_emojis.append(f"    Line {line_no}: {preview}")
+
+        if not count:
+            return None
+
+        return {
+            "path": relative_path,
+            "count": count,
+            "lines": lines_with_emojis,  # First 5 occurrences
+        }
+    except Exception:
+        # Skip files that can't be read
+        return None
+
+
+# Written into the scan cache. The cache holds _scan_one's finished reports
+# (counts and formatted previews), so a cache saved under a different pattern,
+# set of lead bytes, or version of _scan_one itself is discarded
+SCAN_CACHE_VERSION = hashlib.sha256(
+    EMOJI_PATTERN.pattern.encode()
+    + b"".join(EMOJI_LEAD_BYTES)
+    + inspect.getsource(_scan_one).encode()
+).hexdigest()
+
+
+def _load_scan_cache(cache_path: Path) -> dict:
+    """Load {relative_path: [mtime_ns, size, result]} from a previous run.
+
+    Returns an empty cache if the file is missing, unreadable, or was written
+    with a different SCAN_CACHE_VERSION.
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != SCAN_CACHE_VERSION:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_scan_cache(cache_path: Path, cache: dict) -> None:
+    """Persist the scan cache; a failed write only costs a rescan next time."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SCAN_CACHE_VERSION, "files": cache}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def find_files_with_emojis(cache_path: Path | None = None):
+    """Find all files containing emojis.
+
+    If cache_path is given, results are memoized there keyed on each file's
+    (mtime_ns, size), and only files that changed since the last run are rescanned.
+    """
     project_root = Path(__file__).parent.parent
+    cache = _load_scan_cache(cache_path) if cache_path else {}
+    fresh_cache = {}
+    results = {}
+    filepaths = []
+    relative_paths = []
+    for filepath, relative_path, st in iter_source_files(project_root):
+        key = [st.st_mtime_ns, st.st_size]
+        cached = cache.get(relative_path)
+        if cached is not None and cached[:2] == key:
+            fresh_cache[relative_path] = cached
+            results[relative_path] = cached[2]
+        else:
+            fresh_cache[relative_path] = key
+            filepaths.append(filepath)
+            relative_paths.append(relative_path)
+
+    if len(filepaths) <= SERIAL_SCAN_MAX:
+        scanned = map(_scan_one, filepaths, relative_paths)
+    else:
+        # Scanning is CPU-bound and independent per file, so fan out across cores,
+        # with no more workers than there are chunks to hand out
+        chunks = math.ceil(len(filepaths) / SCAN_CHUNKSIZE)
+        with ProcessPoolExecutor(max_workers=min(32, os.cpu_count() or 1, chunks)) as executor:
+            scanned = list(
+                executor.map(_scan_one, filepaths, relative_paths, chunksize=SCAN_CHUNKSIZE)
+            )
+    for relative_path, result in zip(relative_paths, scanned):
+        fresh_cache[relative_path] = fresh_cache[relative_path] + [result]
+        results[relative_path] = result
+
+    if cache_path and (filepaths or len(fresh_cache) != len(cache)):
+        # Rewritten from this walk only, so deleted files drop out of the cache
+        _save_scan_cache(cache_path, fresh_cache)
+
+    return [result for result in results.values() if result]
+
 
-    for root, dirs, files in os.walk(project_root):
-        # Skip directories
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for file in files:
-            if Path(file).suffix in EXTENSIONS:
-                filepath = os.path.join(root, file)
-                relative_path = os.path.relpath(filepath, project_root)
-
-                # Skip allowed files
-                if should_skip_file(relative_path):
-                    continue
-
-                try:
-                    with open(filepath, encoding="utf-8") as f:
-                        content = f.read()
-                        emoji_matches = EMOJI_PATTERN.findall(content)
-                        if emoji_matches:
-                            # Find line numbers with emojis
-                            lines_with_emojis = []
-                            for i, line in enumerate(content.split("\n"), 1):
-                                if EMOJI_PATTERN.search(line):
-                                    # Show emoji and context
-                                    preview = line[:80] + "..." if len(line) > 80 else line
-                                    lines_with_emojis.append(f"    Line {i}: {preview}")
-
-                            files_with_emojis.append(
-                                {
-                                    "path": relative_path,
-                                    "count": len(emoji_matches),
-                                    "lines": lines_with_emojis[:5],  # Show first 5 occurrences
-                                }
-                            )
-                except Exception:
-                    # Skip files that can't be read
-                    pass
-
-    return files_with_emojis
-
-
-def test_no_emojis_in_source_files():
+def test_no_emojis_in_source_files(request):
     """Test that source files contain no emoji characters."""
-    files_with_emojis = find_files_with_emojis()
+    # Reuse results for unchanged files across runs (absent with -p no:cacheprovider)
+    cache = getattr(request.config, "cache", None)
+    cache_path = cache.mkdir("emoji_scan") / "emoji_scan.json" if cache else None
+    files_with_emojis = find_files_with_emojis(cache_path)
 
     if files_with_emojis:
         error_message = [
@@ -3,7 +3,7 @@
 Test Ollama model loading to prevent regression
 
 This test ensures:
-1. Ollama models are loaded dynamically via `ollama list`
+1. Ollama reports its installed models (via the /api/tags endpoint)
 2. Models are formatted correctly for the UI
 3. The endpoint works end-to-end
 
@@ -11,28 +11,39 @@ Note: These tests are skipped if Ollama is not installed/running
 """
 
 import asyncio
-import subprocess
+import os
 
+import httpx
 import pytest
+import pytest_asyncio
 
+# Ollama's REST API - same server the `ollama` CLI talks to
+OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11434")
+DASHBOARD_URL = "http://127.0.0.1:8000"
 
-@pytest.mark.asyncio
-async def test_ollama_list_command():
-    """Verify ollama list command works"""
-    print("Testing: ollama list command...")
+# Share one event loop across the module so the HTTP client fixture can be reused
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def http_client():
+    """One pooled HTTP client for every request in this module."""
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        yield client
+
+
+async def test_ollama_list_command(http_client: httpx.AsyncClient):
+    """Verify Ollama reports its installed models (JSON equivalent of `ollama list`)"""
+    print("Testing: Ollama /api/tags...")
 
     try:
-        process = await asyncio.create_subprocess_shell(
-            "ollama list", stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
+        response = await http_client.get(f"{OLLAMA_HOST}/api/tags")
 
-        if process.returncode != 0:
-            print(f"   FAIL: ollama list failed: {stderr.decode()}")
+        if response.status_code != 200:
+            print(f"   FAIL: /api/tags failed: HTTP {response.status_code}")
             return False
 
-        lines = stdout.decode().strip().split("\n")
-        model_count = len(lines) - 1  # Exclude header
+        model_count = len(response.json().get("models", []))
 
         print(f"   PASS: Found {model_count} Ollama models")
         return True
@@ -47,12 +58,6 @@ async def test_providers_loader():
     print("\nTesting: providers_loader.get_models_for_provider('ollama')...")
 
     try:
-        import sys
-        from pathlib import Path
-
-        # Add src to path
-        sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
         from ax_agent_studio.dashboard.backend.providers_loader import get_models_for_provider
 
         models = await get_models_for_provider("ollama")
@@ -81,30 +86,27 @@ async def test_providers_loader():
         return False
 
 
-async def test_dashboard_endpoint():
+async def test_dashboard_endpoint(http_client: httpx.AsyncClient):
     """Test the dashboard API endpoint"""
     print("\nTesting: Dashboard API endpoint /api/providers/ollama/models...")
 
     try:
-        import httpx
-
         # Note: Dashboard must be running on port 8000
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://127.0.0.1:8000/api/providers/ollama/models")
+        response = await http_client.get(f"{DASHBOARD_URL}/api/providers/ollama/models")
 
-            if response.status_code != 200:
-                print(f"    SKIP: Dashboard not running (status {response.status_code})")
-                return True  # Not a failure, just can't test
+        if response.status_code != 200:
+            print(f"    SKIP: Dashboard not running (status {response.status_code})")
+            return True  # Not a failure, just can't test
 
-            data = response.json()
-            models = data.get("models", [])
+        data = response.json()
+        models = data.get("models", [])
 
-            if not models:
-                print("   FAIL: No models returned from API")
-                return False
+        if not models:
+            print("   FAIL: No models returned from API")
+            return False
 
-            print(f"   PASS: API returned {len(models)} models")
-            return True
+        print(f"   PASS: API returned {len(models)} models")
+        return True
 
     except Exception as e:
         print(f"    SKIP: Dashboard not running ({e})")
@@ -119,14 +121,15 @@ async def main():
 
     results = []
 
-    # Test 1: ollama list command
-    results.append(await test_ollama_list_command())
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        # Test 1: Ollama model listing
+        results.append(await test_ollama_list_command(client))
 
-    # Test 2: providers_loader function
-    results.append(await test_providers_loader())
+        # Test 2: providers_loader function
+        results.append(await test_providers_loader())
 
-    # Test 3: Dashboard API endpoint (optional)
-    results.append(await test_dashboard_endpoint())
+        # Test 3: Dashboard API endpoint (optional)
+        results.append(await test_dashboard_endpoint(client))
 
     # Summary
     print("\n" + "=" * 60)
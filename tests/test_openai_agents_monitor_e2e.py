@@ -6,25 +6,49 @@ Starts the monitor, sends a test message from a different agent, and verifies re
 
 import asyncio
 import os
-import subprocess
 import sys
-import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-# Mark all tests in this file as e2e tests
-pytestmark = pytest.mark.e2e
-
 # Load environment variables from .env file
 load_dotenv()
 
+# Read once, after .env is loaded; gates both collection and start_monitor()
+HAS_OPENAI_KEY = bool(os.getenv("OPENAI_API_KEY"))
+
+# Mark all tests in this file as e2e tests; they share one event loop so the
+# module-scoped monitor fixture can outlive any single test. Without an API key
+# they are skipped up front instead of starting a monitor that can't respond.
+pytestmark = [
+    pytest.mark.e2e,
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.skipif(not HAS_OPENAI_KEY, reason="OPENAI_API_KEY not set"),
+]
+
+# Configuration
+AGENT_NAME = "lunar_craft_128"  # Target agent running OpenAI Agents SDK
+SENDER_HANDLE = "orion_344"  # Valid sender agent (different to avoid self-mention)
+MODEL = "gpt-4o-mini"
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Monitor environment, built once after .env is loaded: PYTHONPATH includes src,
+# and output is unbuffered so startup markers arrive immediately
+MONITOR_ENV = {**os.environ, "PYTHONPATH": str(BASE_DIR / "src"), "PYTHONUNBUFFERED": "1"}
+
+
+async def send_test_message(sender_handle: str, agent_name: str, message: str) -> str:
+    """Send a message to an agent and wait for its reply using MCP wait functionality.
 
-async def send_test_message(sender_handle: str, agent_name: str, message: str):
-    """Send a message to an agent and wait for response using MCP wait functionality"""
+    Returns the text of the first content block of the reply ("" if there is
+    none). Connection and tool errors propagate to the caller.
+    """
 
     # Connect to ax-gcp MCP server
     server_params = StdioServerParameters(
@@ -49,73 +73,87 @@ async def send_test_message(sender_handle: str, agent_name: str, message: str):
 
             # Send message with wait=true and wait_mode='mentions'
             # This will wait for the agent to respond before returning
-            try:
-                result = await session.call_tool(
-                    "messages",
-                    {
-                        "action": "send",
-                        "content": f"@{agent_name} {message}",
-                        "wait": True,
-                        "wait_mode": "mentions",
-                        "timeout": 60,
-                        "context_limit": 5,
-                    },
-                )
-
-                # Parse response
-                if hasattr(result, "content"):
-                    content = result.content
-                    if isinstance(content, list) and len(content) > 0:
-                        text = (
-                            str(content[0].text) if hasattr(content[0], "text") else str(content[0])
-                        )
-                        print(f" Response received:\n{text}\n")
-
-                        # Check if agent responded (should mention the sender)
-                        if f"@{sender_handle}" in text and agent_name in text:
-                            print(" Agent response detected!")
-                            return True
-                        else:
-                            print("  Response format unexpected")
-                            print(f"   Expected mention of @{sender_handle} from @{agent_name}")
-                            return False
-                else:
-                    print("  No content in response")
-                    return False
-
-            except Exception as e:
-                print(f" Error during send/wait: {e}")
-                print("   Monitor may not have responded in time or encountered an error")
-                return False
-
-
-async def test_openai_agents_monitor():
-    """Test the OpenAI Agents SDK monitor end-to-end"""
-    print("=" * 60)
-    print("OpenAI Agents SDK Monitor End-to-End Test")
-    print("=" * 60 + "\n")
+            result = await session.call_tool(
+                "messages",
+                {
+                    "action": "send",
+                    "content": f"@{agent_name} {message}",
+                    "wait": True,
+                    "wait_mode": "mentions",
+                    "timeout": 60,
+                    "context_limit": 5,
+                },
+            )
+
+            # Parse response: text of the first content block, if there is one
+            return next(
+                (str(getattr(item, "text", item)) for item in getattr(result, "content", [])),
+                "",
+            )
+
+
+async def wait_for_startup(
+    process: asyncio.subprocess.Process, output: list[str], timeout: float = 30
+) -> bool:
+    """Read monitor output as it arrives until it reports readiness.
+
+    Returns True on the "Starting FIFO queue manager" marker, False on an auth
+    failure, process exit, or timeout. Lines read are appended to `output`.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    while (remaining := deadline - loop.time()) > 0:
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=remaining)
+        except TimeoutError:
+            return False
 
-    # Configuration
-    agent_name = "lunar_craft_128"  # Target agent running OpenAI Agents SDK
-    sender_handle = "orion_344"  # Valid sender agent (different to avoid self-mention)
-    test_message = "Quick test: What is 2+2? Just answer with the number."
+        if not line:
+            # EOF - process exited
+            await process.wait()
+            return False
+
+        text = line.decode("utf-8", errors="replace")
+        output.append(text)
+        if "Starting FIFO queue manager" in text:
+            return True
+        if "401 Unauthorized" in text:
+            return False
+
+    return False
+
+
+async def drain_output(process: asyncio.subprocess.Process, output: list[str]):
+    """Append the rest of the monitor's output to `output` until EOF."""
+    while line := await process.stdout.readline():
+        output.append(line.decode("utf-8", errors="replace"))
 
+
+@asynccontextmanager
+async def start_monitor(agent_name: str, model: str = MODEL):
+    """Run the OpenAI Agents SDK monitor for the duration of the block.
+
+    Yields True once the monitor reports readiness, False if it could not be
+    started. The process is always cleaned up and its output printed on exit.
+    """
     # Verify OPENAI_API_KEY is set
-    if not os.getenv("OPENAI_API_KEY"):
+    if not HAS_OPENAI_KEY:
         print(" OPENAI_API_KEY not found in environment")
         print("   Set it in your .env file or environment")
-        return False
+        yield False
+        return
 
     # Start the monitor in a subprocess
     print(f" Starting OpenAI Agents SDK monitor for @{agent_name}...")
 
-    base_dir = Path(__file__).resolve().parent.parent
-    venv_python = base_dir / ".venv" / "bin" / "python"
-    config_path = base_dir / "configs" / "agents" / f"{agent_name}.json"
+    venv_python = BASE_DIR / ".venv" / "bin" / "python"
+    config_path = BASE_DIR / "configs" / "agents" / f"{agent_name}.json"
 
     if not config_path.exists():
         print(f" Agent config not found: {config_path}")
-        return False
+        yield False
+        return
 
     # Start monitor process
     monitor_cmd = [
@@ -126,93 +164,116 @@ async def test_openai_agents_monitor():
         "--config",
         str(config_path),
         "--model",
-        "gpt-4o-mini",
+        model,
     ]
 
     print(f"   Command: {' '.join(monitor_cmd)}\n")
 
-    # Set PYTHONPATH to include src
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(base_dir / "src")
-
-    monitor_process = subprocess.Popen(
-        monitor_cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        env=env,
+    monitor_process = await asyncio.create_subprocess_exec(
+        *monitor_cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=MONITOR_ENV,
     )
+    monitor_output: list[str] = []
+    drain_task = None
 
     try:
         # Wait for monitor to initialize (watch for "Starting FIFO queue manager")
         print("⏳ Waiting for monitor to initialize...")
-        initialized = False
-        timeout = 30
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if monitor_process.poll() is not None:
-                # Process died
-                print(" Monitor process died during initialization")
-                stdout, _ = monitor_process.communicate()
-                print(f"Monitor output:\n{stdout}")
-                return False
-
-            # Give it time to start
-            await asyncio.sleep(2)
-
-            # Check if likely initialized (after reasonable time)
-            if time.time() - start_time > 10:
-                initialized = True
-                break
+        initialized = await wait_for_startup(monitor_process, monitor_output, timeout=30)
 
         if not initialized:
-            print(" Monitor did not initialize in time")
-            monitor_process.terminate()
-            return False
+            if monitor_process.returncode is not None:
+                print(" Monitor process died during initialization")
+            else:
+                print(" Monitor did not initialize in time")
+            yield False
+            return
 
-        print(" Monitor appears to be running\n")
+        print(" Monitor is running\n")
 
-        # Send test message from different handle
-        success = await send_test_message(sender_handle, agent_name, test_message)
+        # Keep draining output so the monitor never blocks on a full pipe
+        drain_task = asyncio.create_task(drain_output(monitor_process, monitor_output))
 
-        if success:
-            print("\n End-to-end test PASSED!")
-            print("    Monitor started successfully")
-            print(f"    Message sent from @{sender_handle}")
-            print(f"    @{agent_name} processed and responded")
-            return True
-        else:
-            print("\n Test FAILED: No response detected")
-            print("   Fetching monitor logs for debugging...")
-            return False
+        yield True
 
     finally:
         # Clean up monitor process and show its output
         print("\n Cleaning up monitor process...")
 
-        # Get monitor output before terminating
-        monitor_process.terminate()
+        if monitor_process.returncode is None:
+            monitor_process.terminate()
         try:
-            stdout, _ = monitor_process.communicate(timeout=5)
-            print("\n Monitor Output:")
-            print("=" * 60)
-            print(stdout)
-            print("=" * 60)
-            print(" Monitor process terminated")
-        except subprocess.TimeoutExpired:
+            await asyncio.wait_for(monitor_process.wait(), timeout=5)
+            status = " Monitor process terminated"
+        except TimeoutError:
             monitor_process.kill()
-            stdout, _ = monitor_process.communicate()
-            print("\n Monitor Output:")
-            print("=" * 60)
-            print(stdout)
-            print("=" * 60)
-            print("  Monitor process killed (did not terminate gracefully)")
+            await monitor_process.wait()
+            status = "  Monitor process killed (did not terminate gracefully)"
+
+        # Collect whatever is left in the pipe
+        if drain_task is None:
+            drain_task = asyncio.create_task(drain_output(monitor_process, monitor_output))
+        await drain_task
+
+        print("\n Monitor Output:")
+        print("=" * 60)
+        print("".join(monitor_output))
+        print("=" * 60)
+        print(status)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def running_monitor():
+    """One monitor process shared by every test in this module.
+
+    Startup (interpreter, SDK import, MCP handshake) takes several seconds, so
+    it is paid once rather than per test.
+    """
+    async with start_monitor(AGENT_NAME) as ready:
+        yield ready
+
+
+async def test_openai_agents_monitor(running_monitor: bool):
+    """Test the OpenAI Agents SDK monitor end-to-end"""
+    print("=" * 60)
+    print("OpenAI Agents SDK Monitor End-to-End Test")
+    print("=" * 60 + "\n")
+
+    test_message = "Quick test: What is 2+2? Just answer with the number."
+
+    assert running_monitor, "Monitor did not start (see monitor output)"
+
+    # Send test message from different handle
+    text = await send_test_message(SENDER_HANDLE, AGENT_NAME, test_message)
+    assert text, "No content in response"
+    print(f" Response received:\n{text}\n")
+
+    # Check if agent responded (should mention the sender)
+    success = f"@{SENDER_HANDLE}" in text and AGENT_NAME in text
+    assert success, f"Expected mention of @{SENDER_HANDLE} from @{AGENT_NAME}, got: {text}"
+
+    print("\n End-to-end test PASSED!")
+    print("    Monitor started successfully")
+    print(f"    Message sent from @{SENDER_HANDLE}")
+    print(f"    @{AGENT_NAME} processed and responded")
+
+
+async def main() -> bool:
+    """Run the end-to-end test against a freshly started monitor"""
+    async with start_monitor(AGENT_NAME) as ready:
+        try:
+            await test_openai_agents_monitor(ready)
+        except AssertionError as e:
+            print(f"\n Test FAILED: {e}")
+            return False
+    return True
 
 
 if __name__ == "__main__":
     try:
-        result = asyncio.run(test_openai_agents_monitor())
+        result = asyncio.run(main())
         sys.exit(0 if result else 1)
     except KeyboardInterrupt:
         print("\n\nTest cancelled")
@@ -6,16 +6,12 @@ Tests each provider with LLMFactory to ensure they work before UI integration
 
 import asyncio
 import sys
-from pathlib import Path
 
 import pytest
 
 # Mark all tests in this file as e2e tests
 pytestmark = pytest.mark.e2e
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from ax_agent_studio.llm_factory import create_llm
 
 
@@ -37,17 +33,16 @@ async def test_provider(provider: str, model: str):
 
         messages = [HumanMessage(content="Say 'Hello from {provider}!' in exactly those words.")]
 
-        response = llm.invoke(messages)
-        print(" Response received:")
+        # Async invoke so main() can probe every provider concurrently
+        response = await llm.ainvoke(messages)
+        print(f" Response received from {provider}:")
         print(f"   {response.content[:200]}...")
 
         return True
 
     except Exception as e:
-        print(f" Test failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+        # One line per provider: probes run concurrently, so full tracebacks interleave
+        print(f" Test failed ({provider}): {type(e).__name__}: {e}")
         return False
 
 
@@ -66,14 +61,16 @@ async def main():
         ("ollama", "gpt-oss:latest"),
     ]
 
-    results = {}
-
-    for provider, model in tests:
-        success = await test_provider(provider, model)
-        results[f"{provider}/{model}"] = success
-
-        # Small delay between tests
-        await asyncio.sleep(1)
+    # Providers are independent, so overlap their round trips instead of
+    # waiting on each in turn
+    outcomes = await asyncio.gather(
+        *(test_provider(provider, model) for provider, model in tests),
+        return_exceptions=True,
+    )
+    results = {
+        f"{provider}/{model}": outcome is True
+        for (provider, model), outcome in zip(tests, outcomes, strict=True)
+    }
 
     # Summary
     print("\n" + "=" * 60)
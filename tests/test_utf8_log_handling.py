@@ -5,28 +5,73 @@ import asyncio
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 from ax_agent_studio.dashboard.backend.log_streamer import LogStreamer
 
+# Run every test on one module-wide event loop instead of a fresh loop per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Multi-byte samples (emoji, CJK, symbols) that must survive log streaming intact
+UTF8_SAMPLES = ("🚀", "こんにちは", "✅", "©", "∑")
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="module")
+async def eager_tasks():
+    """Start tasks eagerly: create_task runs the coroutine up to its first real await."""
+    loop = asyncio.get_running_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(None)
+
+
+@pytest.fixture(scope="module")
+def streamer(tmp_path_factory: pytest.TempPathFactory) -> LogStreamer:
+    """One LogStreamer over a module-wide log directory (it keeps no per-stream state)."""
+    return LogStreamer(tmp_path_factory.mktemp("logs"))
+
+
+@pytest.fixture
+def log_file(streamer: LogStreamer, request: pytest.FixtureRequest) -> Path:
+    """A log file private to the current test inside the shared log directory."""
+    return streamer.log_dir / f"{request.node.name}.log"
+
 
 class FakeWebSocket:
     """Minimal WebSocket stub that captures payloads."""
 
     def __init__(self):
         self.messages = []
+        self._received = asyncio.Event()
 
     async def send_json(self, payload):
         self.messages.append(payload)
+        self._received.set()
 
+    async def wait_for_content(self, text: str, timeout: float = 2.0):
+        """Wait until a sent payload's content contains `text`."""
+        async with asyncio.timeout(timeout):
+            while not any(text in msg.get("content", "") for msg in self.messages):
+                self._received.clear()
+                await self._received.wait()
 
-@pytest.mark.asyncio
-async def test_utf8_characters_in_logs(tmp_path: Path):
-    """Test that UTF-8 characters (emoji, unicode) are properly handled."""
-    # Setup
-    log_dir = tmp_path / "logs"
-    log_dir.mkdir()
-    log_file = log_dir / "test_monitor.log"
 
+async def stream_until(streamer: LogStreamer, websocket: FakeWebSocket, monitor_id: str, text: str):
+    """Run stream_logs until `text` has been sent, then stop it.
+
+    stream_logs tails the file forever after sending its existing content, so it
+    has to be cancelled once the payload under test has arrived.
+    """
+    task = asyncio.create_task(streamer.stream_logs(websocket, monitor_id))
+    try:
+        await websocket.wait_for_content(text)
+    finally:
+        task.cancel()
+        await task  # stream_logs swallows the cancellation and returns
+
+
+async def test_utf8_characters_in_logs(streamer: LogStreamer, log_file: Path):
+    """Test that UTF-8 characters (emoji, unicode) are properly handled."""
     # Write log with various UTF-8 characters
     log_content = """=== Test Log ===
 Hello World! 🚀
@@ -37,12 +82,10 @@ Math symbols: ∑ ∫ ∂ ∞ √
 """
     log_file.write_text(log_content, encoding="utf-8")
 
-    # Create streamer and fake websocket
-    streamer = LogStreamer(log_dir)
     websocket = FakeWebSocket()
 
     # Stream the logs
-    await streamer.stream_logs(websocket, "test_monitor")
+    await stream_until(streamer, websocket, log_file.stem, "Math symbols")
 
     # Verify: should have received the log content
     assert len(websocket.messages) > 0
@@ -51,21 +94,13 @@ Math symbols: ∑ ∫ ∂ ∞ √
 
     received_content = log_messages[0]["content"]
 
-    # Verify all special characters are preserved
-    assert "🚀" in received_content
-    assert "こんにちは" in received_content
-    assert "✅" in received_content
-    assert "©" in received_content
-    assert "∑" in received_content
+    # Verify all special characters are preserved (report every one that isn't)
+    missing = [text for text in UTF8_SAMPLES if text not in received_content]
+    assert not missing, f"Characters lost in streaming: {missing}"
 
 
-@pytest.mark.asyncio
-async def test_utf8_with_replacement_on_invalid_bytes(tmp_path: Path):
+async def test_utf8_with_replacement_on_invalid_bytes(streamer: LogStreamer, log_file: Path):
     """Test that invalid UTF-8 bytes are replaced, not crashed."""
-    log_dir = tmp_path / "logs"
-    log_dir.mkdir()
-    log_file = log_dir / "test_monitor.log"
-
     # Write valid UTF-8 content first
     log_file.write_text("Valid content\n", encoding="utf-8")
 
@@ -74,11 +109,10 @@ async def test_utf8_with_replacement_on_invalid_bytes(tmp_path: Path):
         f.write(b"Invalid bytes: \xff\xfe\n")
         f.write("More valid content\n".encode("utf-8"))
 
-    streamer = LogStreamer(log_dir)
     websocket = FakeWebSocket()
 
     # Should not crash, should handle with errors="replace"
-    await streamer.stream_logs(websocket, "test_monitor")
+    await stream_until(streamer, websocket, log_file.stem, "More valid content")
 
     assert len(websocket.messages) > 0
     log_messages = [msg for msg in websocket.messages if msg.get("type") == "log"]
@@ -90,44 +124,35 @@ async def test_utf8_with_replacement_on_invalid_bytes(tmp_path: Path):
     assert "More valid content" in received_content
 
 
-@pytest.mark.asyncio
-async def test_utf8_in_tail_mode(tmp_path: Path):
-    """Test that UTF-8 characters work in tail/streaming mode."""
-    log_dir = tmp_path / "logs"
-    log_dir.mkdir()
-    log_file = log_dir / "test_monitor.log"
+async def test_tail_delivers_appended_utf8_line(streamer: LogStreamer, log_file: Path):
+    """Test that tail mode delivers a line appended after it started, UTF-8 intact.
 
+    Decoding of full logs is covered deterministically by the stream_logs tests
+    above; this only checks the tail loop's hand-off of one new line.
+    """
     # Start with initial content
     log_file.write_text("Initial log\n", encoding="utf-8")
 
-    streamer = LogStreamer(log_dir)
     websocket = FakeWebSocket()
 
     # Start tailing in background
-    tail_task = asyncio.create_task(streamer._tail_log_file(websocket, log_file, "test_monitor"))
+    tail_task = asyncio.create_task(streamer._tail_log_file(websocket, log_file, log_file.stem))
 
-    # Give it time to start
+    # Give it time to open the file and seek to the end
     await asyncio.sleep(0.2)
 
     # Append UTF-8 content
+    appended = "New line with emoji: 🎯\n"
     with open(log_file, "a", encoding="utf-8") as f:
-        f.write("New line with emoji: 🎯\n")
-        f.flush()
+        f.write(appended)
 
-    # Give it time to read
-    await asyncio.sleep(0.3)
-
-    # Cancel the tail task
-    tail_task.cancel()
+    # Wait for the tail loop to deliver the new line, then stop it
     try:
-        await tail_task
-    except asyncio.CancelledError:
-        pass
+        await websocket.wait_for_content("🎯")
+    finally:
+        tail_task.cancel()
+        await tail_task  # _tail_log_file swallows the cancellation and returns
 
-    # Verify we received the new content
+    # Only the appended line is sent: the tail starts from the end of the file
     log_messages = [msg for msg in websocket.messages if msg.get("type") == "log"]
-    assert len(log_messages) > 0
-
-    # Check if emoji was received
-    all_content = "".join(msg["content"] for msg in log_messages)
-    assert "🎯" in all_content
+    assert [msg["content"] for msg in log_messages] == [appended]